@@ -2,20 +2,21 @@
 Command implementations for speculate CLI.
 
 Each command is a function with a docstring that serves as CLI help.
-Only copier is lazy-imported (it's a large package).
+Large or rarely needed imports (copier, prettyfmt, importlib.metadata) are
+lazy-imported so that importing this module (e.g. for the header helpers) stays cheap.
 """
 
 from __future__ import annotations
 
+import json
+import os
 import re
 import shutil
 from datetime import UTC, datetime
-from importlib.metadata import version
 from pathlib import Path
 from typing import Any, cast
 
 import yaml
-from prettyfmt import fmt_count_items, fmt_size_human
 from rich import print as rprint
 from strif import atomic_output_file
 
@@ -47,6 +48,7 @@ PACKAGE_NAME = "speculate-cli"
 SPECULATE_DIR = ".speculate"
 COPIER_ANSWERS_FILE = f"{SPECULATE_DIR}/copier-answers.yml"
 SETTINGS_FILE = f"{SPECULATE_DIR}/settings.yml"
+INSTALLED_LINKS_FILE = f"{SPECULATE_DIR}/installed_links.json"
 
 
 def init(
@@ -70,6 +72,7 @@ def init(
       speculate init --ref v1.0.0 # Use specific tag/commit
     """
     import copier  # Lazy import - large package
+    from prettyfmt import fmt_count_items, fmt_size_human
 
     dst = Path(destination).resolve()
     docs_path = dst / "docs"
@@ -193,7 +196,7 @@ def install(
       - .speculate/settings.yml (install metadata)
       - CLAUDE.md (for Claude Code) — adds speculate header if missing
       - AGENTS.md (for Codex) — adds speculate header if missing
-      - .cursor/rules/ (symlinks for Cursor)
+      - .cursor/rules/ (symlinks for Cursor, recorded in .speculate/installed_links.json)
 
     If CLAUDE.md doesn't exist, creates it as a symlink to AGENTS.md.
     If CLAUDE.md already exists as a regular file, updates both files.
@@ -269,6 +272,8 @@ def status() -> None:
     Examples:
       speculate status
     """
+    from prettyfmt import fmt_count_items, fmt_size_human
+
     cwd = Path.cwd()
     has_errors = False
 
@@ -352,6 +357,8 @@ def _update_speculate_settings(project_root: Path) -> None:
     # Update with current info
     settings["last_update"] = datetime.now(UTC).isoformat()
     try:
+        from importlib.metadata import version
+
         settings["last_cli_version"] = version(PACKAGE_NAME)
     except Exception:
         settings["last_cli_version"] = "unknown"
@@ -528,6 +535,13 @@ def _setup_cursor_rules(
     skipped_by_pattern = 0
     skipped_existing = 0
 
+    # Keep links recorded by earlier installs (e.g. with different include patterns).
+    # Installs from before the manifest existed are migrated with a one-time scan.
+    recorded_links = _read_installed_links(project_root)
+    if recorded_links is None:
+        recorded_links = [p for p in cursor_dir.glob("*.mdc") if _is_speculate_link(p)]
+    installed_links = set(recorded_links)
+
     for stem in sorted(rules.keys()):
         rule_path, relative_dir = rules[stem]
 
@@ -543,14 +557,19 @@ def _setup_cursor_rules(
         if link_path.exists() or link_path.is_symlink():
             if not force:
                 skipped_existing += 1
+                if _is_speculate_link(link_path):
+                    installed_links.add(link_path)
                 continue
             link_path.unlink()
 
         # Create relative symlink
         relative_target = Path("..") / ".." / relative_dir / rule_path.name
         link_path.symlink_to(relative_target)
+        installed_links.add(link_path)
         linked_count += 1
 
+    _write_installed_links(project_root, [p for p in installed_links if _is_speculate_link(p)])
+
     # Build informative message
     msg_parts: list[str] = []
     if linked_count:
@@ -567,35 +586,81 @@ def _setup_cursor_rules(
         print_info(".cursor/rules/: no changes")
 
 
+def _is_speculate_link(path: Path) -> bool:
+    """Check if path is a symlink whose target is in docs/{general,project}/agent-rules/."""
+    if not path.is_symlink():
+        return False
+    target = Path(os.readlink(path)).as_posix()
+    return "docs/general/agent-rules/" in target or "docs/project/agent-rules/" in target
+
+
+def _read_installed_links(project_root: Path) -> list[Path] | None:
+    """Read the .cursor/rules/ links recorded in .speculate/installed_links.json.
+
+    Returns None if there is no usable manifest (missing, e.g. installs from older
+    CLI versions, or unparsable), so callers fall back to scanning .cursor/rules/.
+    Entries that are not directly inside .cursor/rules/ are ignored.
+    """
+    manifest = project_root / INSTALLED_LINKS_FILE
+    try:
+        with open(manifest) as f:
+            entries = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(entries, list):
+        return None
+
+    cursor_dir = os.path.normpath(project_root / ".cursor" / "rules")
+    links: list[Path] = []
+    for entry in cast(list[Any], entries):
+        if not isinstance(entry, str):
+            continue
+        link_path = Path(os.path.normpath(project_root / entry))
+        if str(link_path.parent) == cursor_dir:
+            links.append(link_path)
+    return links
+
+
+def _write_installed_links(project_root: Path, links: list[Path]) -> None:
+    """Record created .cursor/rules/ links so uninstall can remove them without scanning."""
+    manifest = project_root / INSTALLED_LINKS_FILE
+    manifest.parent.mkdir(parents=True, exist_ok=True)
+    entries = sorted(link.relative_to(project_root).as_posix() for link in links)
+    with atomic_output_file(manifest) as temp_path:
+        Path(temp_path).write_text(json.dumps(entries, indent=2) + "\n")
+
+
 def _remove_cursor_rules(project_root: Path) -> None:
     """Remove .cursor/rules/*.mdc symlinks that point to speculate docs.
 
-    Only removes symlinks, not regular files. Also removes broken symlinks.
-    Handles symlinks to both docs/general/agent-rules/ and docs/project/agent-rules/.
+    If .speculate/installed_links.json exists, removes the links it lists that still
+    point to speculate docs. Otherwise falls back to scanning .cursor/rules/.
+    The manifest itself is removed either way.
+
+    Either way, only removes symlinks whose target is in docs/general/agent-rules/
+    or docs/project/agent-rules/ (even if broken), never regular files.
     """
+    installed_links = _read_installed_links(project_root)
+    (project_root / INSTALLED_LINKS_FILE).unlink(missing_ok=True)
+    if installed_links is not None:
+        removed_count = 0
+        for link_path in installed_links:
+            if _is_speculate_link(link_path):
+                link_path.unlink()
+                removed_count += 1
+        if removed_count > 0:
+            print_success(f"Removed {removed_count} symlinks from .cursor/rules/")
+        return
+
     cursor_dir = project_root / ".cursor" / "rules"
     if not cursor_dir.exists():
         return
 
     removed_count = 0
     for link_path in cursor_dir.glob("*.mdc"):
-        if link_path.is_symlink():
-            # Check if it points to our docs (or is broken)
-            try:
-                target = link_path.resolve()
-                # Remove if it points to docs/general/agent-rules/ or docs/project/agent-rules/ or is broken
-                target_str = str(target)
-                if (
-                    "docs/general/agent-rules" in target_str
-                    or "docs/project/agent-rules" in target_str
-                    or not target.exists()
-                ):
-                    link_path.unlink()
-                    removed_count += 1
-            except OSError:
-                # Broken symlink, remove it
-                link_path.unlink()
-                removed_count += 1
+        if _is_speculate_link(link_path):
+            link_path.unlink()
+            removed_count += 1
 
     if removed_count > 0:
         print_success(f"Removed {removed_count} symlinks from .cursor/rules/")
@@ -608,6 +673,7 @@ def uninstall(force: bool = False) -> None:
       - Speculate header from CLAUDE.md (preserves other content)
       - Speculate header from AGENTS.md (preserves other content)
       - .cursor/rules/*.mdc symlinks that point to speculate docs
+        (as recorded in .speculate/installed_links.json, if present)
       - .speculate/settings.yml
 
     Does NOT remove:
@@ -636,11 +702,18 @@ def uninstall(force: bool = False) -> None:
     if agents_md.exists() and SPECULATE_MARKER in agents_md.read_text():
         changes.append("Remove speculate header from AGENTS.md")
 
+    installed_links = _read_installed_links(cwd)
     cursor_rules = cwd / ".cursor" / "rules"
-    if cursor_rules.exists():
-        symlinks = [f for f in cursor_rules.glob("*.mdc") if f.is_symlink()]
-        if symlinks:
-            changes.append(f"Remove {len(symlinks)} symlinks from .cursor/rules/")
+    if installed_links is not None:
+        symlinks = [f for f in installed_links if _is_speculate_link(f)]
+    elif cursor_rules.exists():
+        symlinks = [f for f in cursor_rules.glob("*.mdc") if _is_speculate_link(f)]
+    else:
+        symlinks = []
+    if symlinks:
+        changes.append(f"Remove {len(symlinks)} symlinks from .cursor/rules/")
+    elif (cwd / INSTALLED_LINKS_FILE).exists():
+        changes.append(f"Remove {INSTALLED_LINKS_FILE}")
 
     settings_file = cwd / SETTINGS_FILE
     if settings_file.exists():
@@ -0,0 +1,56 @@
+"""Shared pytest configuration for speculate CLI tests."""
+
+import os
+import shutil
+import stat
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# Number of previous runs' temp dirs to keep, matching pytest's default retention.
+_KEEP_RUNS = 3
+
+
+def _tmpfs_root() -> Path | None:
+    """Return a private per-user directory on /dev/shm, or None if unusable."""
+    if not os.access("/dev/shm", os.W_OK):
+        return None
+    root = Path(f"/dev/shm/pytest-of-{os.getuid()}")
+    try:
+        root.mkdir(mode=0o700, exist_ok=True)
+        st = os.lstat(root)
+    except OSError:
+        return None
+    # Like pytest's own temproot handling: refuse symlinks and other users' dirs.
+    if stat.S_ISLNK(st.st_mode) or st.st_uid != os.getuid():
+        return None
+    return root
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Put pytest's temp dirs on tmpfs under Linux to avoid disk I/O.
+
+    Tests are filesystem-bound (mkdir, small writes, symlinks). Each run gets its
+    own directory under /dev/shm/pytest-of-<uid>/, so concurrent runs don't
+    collide, and the last few runs are retained for inspection. TMPDIR is
+    untouched, so subprocesses keep using the normal temp dir. An explicit
+    --basetemp is respected (as are xdist workers, which inherit one).
+    Set SPECULATE_TESTS_REAL_FS=1 to opt out.
+    """
+    if (
+        config.option.basetemp is not None
+        or not sys.platform.startswith("linux")
+        or os.environ.get("SPECULATE_TESTS_REAL_FS")
+    ):
+        return
+    root = _tmpfs_root()
+    if root is None:
+        return
+
+    previous_runs = sorted(root.glob("pytest-*"), key=lambda p: p.stat().st_mtime)
+    for old in previous_runs[: max(0, len(previous_runs) - _KEEP_RUNS)]:
+        shutil.rmtree(old, ignore_errors=True)
+
+    config.option.basetemp = tempfile.mkdtemp(prefix="pytest-", dir=root)
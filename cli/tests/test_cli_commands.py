@@ -1,11 +1,17 @@
 """Tests for CLI commands."""
 
+import itertools
+import json
 import os
+import re
+import shutil
+import stat
+from collections.abc import Callable, Iterator
 from pathlib import Path
+from typing import Any, NamedTuple
 
 import pytest
 import yaml
-from pytest import MonkeyPatch
 
 from speculate.cli.cli_commands import (
     SPECULATE_HEADER,
@@ -20,6 +26,127 @@ from speculate.cli.cli_commands import (
     uninstall,
 )
 
+# Prefer the libyaml-backed C loader/dumper when available (much faster).
+try:
+    from yaml import CSafeDumper as _Dumper
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeDumper as _Dumper
+    from yaml import SafeLoader as _Loader
+
+_dump = lambda d: yaml.dump(d, Dumper=_Dumper)
+
+
+def _load_file(path: Path) -> Any:
+    """Load a YAML file from its raw bytes (libyaml decodes UTF-8 itself)."""
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=_Loader)
+
+
+# Precomputed header fixtures (the header is ASCII, so the bytes form can be written directly).
+_HEADER_PLUS_NL = SPECULATE_HEADER + "\n"
+_HEADER_PLUS_BLANK = SPECULATE_HEADER + "\n\n"
+_HEADER_PLUS_NL_BYTES = _HEADER_PLUS_NL.encode("utf-8")
+
+# Rendered copier-answers.yml, encoded once so tests can write it with `write_bytes`.
+_COPIER_ANSWERS_BYTES = _dump({"_commit": "abc123", "_src_path": "test"}).encode("utf-8")
+_COPIER_ANSWERS_VERSIONED_BYTES = _dump({"_commit": "v1.2.3", "_src_path": "gh:test/repo"}).encode(
+    "utf-8"
+)
+
+_scratch_counter = itertools.count()
+
+# Captured once so per-test chdir fixtures don't need to call os.getcwd().
+_ORIG_CWD = os.getcwd()
+
+
+@pytest.fixture(scope="session")
+def scratch_root(
+    request: pytest.FixtureRequest, tmp_path_factory: pytest.TempPathFactory
+) -> Iterator[Path]:
+    """Single scratch directory shared by all tests, removed at session teardown.
+
+    Kept if any test failed, so failing tests' directories can be inspected.
+    (Under pytest-xdist, tmp_path_factory is already per-worker.)
+    """
+    root = tmp_path_factory.mktemp("speculate", numbered=True)
+    yield root
+    if request.session.testsfailed == 0:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+@pytest.fixture
+def tmp_path(request: pytest.FixtureRequest, scratch_root: Path) -> Path:
+    """Per-test directory under the session scratch root (shadows pytest's `tmp_path`).
+
+    Avoids the per-test mkdtemp and retention bookkeeping of the builtin fixture.
+    Named after the test (sanitized like pytest's own) plus a counter for uniqueness.
+    """
+    name = re.sub(r"\W", "_", request.node.name)[:30]
+    path = scratch_root / f"{name}{next(_scratch_counter)}"
+    path.mkdir()
+    return path
+
+
+@pytest.fixture
+def chdir_tmp(tmp_path: Path) -> Iterator[Path]:
+    """Run the test with tmp_path as the working directory."""
+    os.chdir(tmp_path)
+    try:
+        yield tmp_path
+    finally:
+        os.chdir(_ORIG_CWD)
+
+
+def _expect_exit(command: Callable[[], None], expected: int) -> None:
+    """Run a command and assert it exits with the expected code.
+
+    A plain try/except, without the traceback capture of `pytest.raises`.
+    """
+    try:
+        command()
+    except SystemExit as e:
+        assert e.code == expected
+    else:
+        pytest.fail(f"{command.__name__}() did not exit (expected code {expected})")
+
+
+def _stat_kind(path: Path) -> str | None:
+    """Return "symlink", "file", "dir", "other" or None (missing) using a single lstat call."""
+    try:
+        st = os.lstat(path)
+    except FileNotFoundError:
+        return None
+    if stat.S_ISLNK(st.st_mode):
+        return "symlink"
+    if stat.S_ISREG(st.st_mode):
+        return "file"
+    if stat.S_ISDIR(st.st_mode):
+        return "dir"
+    return "other"
+
+
+class _Symlink(NamedTuple):
+    """A `_scaffold` entry that creates a symlink to `target` instead of a file."""
+
+    target: str
+
+
+_RULE_LINK = _Symlink("../../docs/general/agent-rules/test-rule.md")
+
+
+def _scaffold(root: Path, files: dict[str, str | bytes | _Symlink]) -> None:
+    """Write files (relative path -> content) under root, creating parent dirs as needed."""
+    for rel, content in files.items():
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if isinstance(content, _Symlink):
+            os.symlink(content.target, path)
+        elif isinstance(content, bytes):
+            path.write_bytes(content)
+        else:
+            path.write_text(content)
+
 
 class TestUpdateSpeculateSettings:
     """Tests for _update_speculate_settings function."""
@@ -31,20 +158,18 @@ class TestUpdateSpeculateSettings:
         settings_file = tmp_path / ".speculate" / "settings.yml"
         assert settings_file.exists()
 
-        settings = yaml.safe_load(settings_file.read_text())
+        settings = _load_file(settings_file)
         assert "last_update" in settings
         assert "last_cli_version" in settings
 
     def test_updates_existing_settings(self, tmp_path: Path):
         """Should update existing settings file."""
-        settings_dir = tmp_path / ".speculate"
-        settings_dir.mkdir()
-        settings_file = settings_dir / "settings.yml"
-        settings_file.write_text(yaml.dump({"custom_key": "custom_value"}))
+        _scaffold(tmp_path, {".speculate/settings.yml": _dump({"custom_key": "custom_value"})})
+        settings_file = tmp_path / ".speculate" / "settings.yml"
 
         _update_speculate_settings(tmp_path)
 
-        settings = yaml.safe_load(settings_file.read_text())
+        settings = _load_file(settings_file)
         # Existing keys should be preserved
         assert settings.get("custom_key") == "custom_value"
         # New keys should be added
@@ -52,82 +177,70 @@ class TestUpdateSpeculateSettings:
 
     def test_reads_docs_version_from_copier_answers(self, tmp_path: Path):
         """Should read docs version from .speculate/copier-answers.yml."""
-        speculate_dir = tmp_path / ".speculate"
-        speculate_dir.mkdir()
-        copier_answers = speculate_dir / "copier-answers.yml"
-        copier_answers.write_text(yaml.dump({"_commit": "v1.2.3", "_src_path": "gh:test/repo"}))
+        _scaffold(tmp_path, {".speculate/copier-answers.yml": _COPIER_ANSWERS_VERSIONED_BYTES})
 
         _update_speculate_settings(tmp_path)
 
         settings_file = tmp_path / ".speculate" / "settings.yml"
-        settings = yaml.safe_load(settings_file.read_text())
+        settings = _load_file(settings_file)
         assert settings.get("last_docs_version") == "v1.2.3"
 
 
 class TestSetupCursorRules:
     """Tests for _setup_cursor_rules function."""
 
-    def test_creates_cursor_rules_directory(self, tmp_path: Path):
-        """Should create .cursor/rules/ directory."""
-        rules_dir = tmp_path / "docs" / "general" / "agent-rules"
-        rules_dir.mkdir(parents=True)
-
-        _setup_cursor_rules(tmp_path)
-
-        cursor_dir = tmp_path / ".cursor" / "rules"
-        assert cursor_dir.exists()
-
-    def test_creates_symlinks_for_md_files(self, tmp_path: Path):
-        """Should create symlinks with .mdc extension."""
-        rules_dir = tmp_path / "docs" / "general" / "agent-rules"
-        rules_dir.mkdir(parents=True)
-        (rules_dir / "general-rules.md").write_text("# General Rules")
-        (rules_dir / "python-rules.md").write_text("# Python Rules")
-
-        _setup_cursor_rules(tmp_path)
-
-        cursor_dir = tmp_path / ".cursor" / "rules"
-        assert (cursor_dir / "general-rules.mdc").is_symlink()
-        assert (cursor_dir / "python-rules.mdc").is_symlink()
-
-    def test_symlinks_are_relative(self, tmp_path: Path):
-        """Symlinks should be relative paths."""
-        rules_dir = tmp_path / "docs" / "general" / "agent-rules"
-        rules_dir.mkdir(parents=True)
-        (rules_dir / "test.md").write_text("# Test")
-
-        _setup_cursor_rules(tmp_path)
-
-        link = tmp_path / ".cursor" / "rules" / "test.mdc"
-        target = os.readlink(link)
-        assert not target.startswith("/")
-        assert "docs/general/agent-rules/test.md" in target
-
-    def test_include_pattern_filters_rules(self, tmp_path: Path):
-        """Include pattern should filter which rules are linked."""
-        rules_dir = tmp_path / "docs" / "general" / "agent-rules"
-        rules_dir.mkdir(parents=True)
-        (rules_dir / "general-rules.md").write_text("# General Rules")
-        (rules_dir / "python-rules.md").write_text("# Python Rules")
-
-        _setup_cursor_rules(tmp_path, include=["general-*.md"])
-
-        cursor_dir = tmp_path / ".cursor" / "rules"
-        assert (cursor_dir / "general-rules.mdc").exists()
-        assert not (cursor_dir / "python-rules.mdc").exists()
-
-    def test_exclude_pattern_filters_rules(self, tmp_path: Path):
-        """Exclude pattern should filter out matching rules."""
+    @pytest.mark.parametrize(
+        "rules,kwargs,expected_present,expected_absent",
+        [
+            pytest.param([], {}, [], [], id="creates-cursor-rules-dir"),
+            pytest.param(
+                ["general-rules.md", "python-rules.md"],
+                {},
+                ["general-rules.mdc", "python-rules.mdc"],
+                [],
+                id="symlinks-md-files",
+            ),
+            pytest.param(
+                ["general-rules.md", "python-rules.md"],
+                {"include": ["general-*.md"]},
+                ["general-rules.mdc"],
+                ["python-rules.mdc"],
+                id="include-pattern",
+            ),
+            pytest.param(
+                ["general-rules.md", "convex-rules.md"],
+                {"exclude": ["convex-*.md"]},
+                ["general-rules.mdc"],
+                ["convex-rules.mdc"],
+                id="exclude-pattern",
+            ),
+        ],
+    )
+    def test_links_rules(
+        self,
+        tmp_path: Path,
+        rules: list[str],
+        kwargs: dict[str, list[str]],
+        expected_present: list[str],
+        expected_absent: list[str],
+    ):
+        """Should create relative .mdc symlinks for rules matching include/exclude patterns."""
         rules_dir = tmp_path / "docs" / "general" / "agent-rules"
         rules_dir.mkdir(parents=True)
-        (rules_dir / "general-rules.md").write_text("# General Rules")
-        (rules_dir / "convex-rules.md").write_text("# Convex Rules")
+        _scaffold(rules_dir, {name: f"# {name}" for name in rules})
 
-        _setup_cursor_rules(tmp_path, exclude=["convex-*.md"])
+        _setup_cursor_rules(tmp_path, **kwargs)
 
         cursor_dir = tmp_path / ".cursor" / "rules"
-        assert (cursor_dir / "general-rules.mdc").exists()
-        assert not (cursor_dir / "convex-rules.mdc").exists()
+        assert _stat_kind(cursor_dir) == "dir"
+        for name in expected_present:
+            link = cursor_dir / name
+            assert _stat_kind(link) == "symlink"
+            target = os.readlink(link)
+            assert not target.startswith("/")
+            assert f"docs/general/agent-rules/{Path(name).stem}.md" in target
+        for name in expected_absent:
+            assert _stat_kind(cursor_dir / name) is None
 
     def test_warns_when_rules_dir_missing(self, tmp_path: Path):
         """Should warn when docs/general/agent-rules/ doesn't exist."""
@@ -136,55 +249,83 @@ class TestSetupCursorRules:
 
     def test_skips_existing_symlinks_without_force(self, tmp_path: Path):
         """Should skip existing symlinks unless force=True."""
-        rules_dir = tmp_path / "docs" / "general" / "agent-rules"
-        rules_dir.mkdir(parents=True)
-        (rules_dir / "test.md").write_text("# Test")
+        _scaffold(tmp_path, {"docs/general/agent-rules/test.md": "# Test"})
 
         # First run creates the symlink
         _setup_cursor_rules(tmp_path)
         cursor_dir = tmp_path / ".cursor" / "rules"
         link = cursor_dir / "test.mdc"
-        assert link.is_symlink()
+        assert _stat_kind(link) == "symlink"
 
         # Second run without force should skip
         _setup_cursor_rules(tmp_path)
-        assert link.is_symlink()
+        assert _stat_kind(link) == "symlink"
 
     def test_overwrites_existing_symlinks_with_force(self, tmp_path: Path):
         """Should overwrite existing symlinks when force=True."""
-        rules_dir = tmp_path / "docs" / "general" / "agent-rules"
-        rules_dir.mkdir(parents=True)
-        (rules_dir / "test.md").write_text("# Test")
+        _scaffold(tmp_path, {"docs/general/agent-rules/test.md": "# Test"})
 
         # First run creates the symlink
         _setup_cursor_rules(tmp_path)
         cursor_dir = tmp_path / ".cursor" / "rules"
         link = cursor_dir / "test.mdc"
-        assert link.is_symlink()
+        assert _stat_kind(link) == "symlink"
 
         # Second run with force should overwrite
         _setup_cursor_rules(tmp_path, force=True)
-        assert link.is_symlink()
+        assert _stat_kind(link) == "symlink"
+
+    def test_records_installed_links_manifest(self, tmp_path: Path):
+        """Should record created links in .speculate/installed_links.json across runs."""
+        _scaffold(
+            tmp_path,
+            {
+                "docs/general/agent-rules/general-rules.md": "# General Rules",
+                "docs/general/agent-rules/python-rules.md": "# Python Rules",
+            },
+        )
+
+        _setup_cursor_rules(tmp_path, include=["general-*.md"])
+        _setup_cursor_rules(tmp_path, include=["python-*.md"])
+
+        manifest = tmp_path / ".speculate" / "installed_links.json"
+        assert json.loads(manifest.read_text()) == [
+            ".cursor/rules/general-rules.mdc",
+            ".cursor/rules/python-rules.mdc",
+        ]
+
+    def test_manifest_skips_user_owned_links(self, tmp_path: Path):
+        """Existing links that don't point to agent-rules should not be recorded."""
+        _scaffold(
+            tmp_path,
+            {
+                "docs/general/agent-rules/python-rules.md": "# Python Rules",
+                ".cursor/rules/python-rules.mdc": _Symlink("../../mine/py.md"),
+            },
+        )
+
+        _setup_cursor_rules(tmp_path)
+
+        manifest = tmp_path / ".speculate" / "installed_links.json"
+        assert json.loads(manifest.read_text()) == []
 
     def test_merges_general_and_project_rules(self, tmp_path: Path):
         """Should merge rules from general and project directories."""
-        # Create general rules
-        general_rules = tmp_path / "docs" / "general" / "agent-rules"
-        general_rules.mkdir(parents=True)
-        (general_rules / "general-rules.md").write_text("# General")
-        (general_rules / "shared-rules.md").write_text("# General Shared")
-
-        # Create project rules
-        project_rules = tmp_path / "docs" / "project" / "agent-rules"
-        project_rules.mkdir(parents=True)
-        (project_rules / "project-rules.md").write_text("# Project")
+        _scaffold(
+            tmp_path,
+            {
+                "docs/general/agent-rules/general-rules.md": "# General",
+                "docs/general/agent-rules/shared-rules.md": "# General Shared",
+                "docs/project/agent-rules/project-rules.md": "# Project",
+            },
+        )
 
         _setup_cursor_rules(tmp_path)
 
         cursor_dir = tmp_path / ".cursor" / "rules"
-        assert (cursor_dir / "general-rules.mdc").is_symlink()
-        assert (cursor_dir / "shared-rules.mdc").is_symlink()
-        assert (cursor_dir / "project-rules.mdc").is_symlink()
+        assert _stat_kind(cursor_dir / "general-rules.mdc") == "symlink"
+        assert _stat_kind(cursor_dir / "shared-rules.mdc") == "symlink"
+        assert _stat_kind(cursor_dir / "project-rules.mdc") == "symlink"
 
         # Verify project-rules points to project directory
         target = os.readlink(cursor_dir / "project-rules.mdc")
@@ -192,21 +333,20 @@ class TestSetupCursorRules:
 
     def test_project_rules_override_general(self, tmp_path: Path):
         """Project rules should take precedence over general rules of same name."""
-        # Create general rules
-        general_rules = tmp_path / "docs" / "general" / "agent-rules"
-        general_rules.mkdir(parents=True)
-        (general_rules / "python-rules.md").write_text("# General Python")
-
-        # Create project rules with same name
-        project_rules = tmp_path / "docs" / "project" / "agent-rules"
-        project_rules.mkdir(parents=True)
-        (project_rules / "python-rules.md").write_text("# Project Python")
+        # General and project rules with the same name
+        _scaffold(
+            tmp_path,
+            {
+                "docs/general/agent-rules/python-rules.md": "# General Python",
+                "docs/project/agent-rules/python-rules.md": "# Project Python",
+            },
+        )
 
         _setup_cursor_rules(tmp_path)
 
         cursor_dir = tmp_path / ".cursor" / "rules"
         link = cursor_dir / "python-rules.mdc"
-        assert link.is_symlink()
+        assert _stat_kind(link) == "symlink"
 
         # Should point to project version, not general
         target = os.readlink(link)
@@ -214,59 +354,47 @@ class TestSetupCursorRules:
         assert "docs/general/agent-rules" not in target
 
 
+@pytest.mark.usefixtures("chdir_tmp")
 class TestInstallCommand:
     """Tests for install command."""
 
-    def test_fails_without_docs_directory(self, tmp_path: Path, monkeypatch: MonkeyPatch):
+    def test_fails_without_docs_directory(self, tmp_path: Path):
         """Should fail if docs/ directory doesn't exist."""
-        monkeypatch.chdir(tmp_path)
+        _expect_exit(install, expected=1)
 
-        with pytest.raises(SystemExit) as exc_info:
-            install()
-        assert exc_info.value.code == 1
-
-    def test_creates_all_configs(self, tmp_path: Path, monkeypatch: MonkeyPatch):
+    def test_creates_all_configs(self, tmp_path: Path):
         """Should create all tool configurations."""
         # Setup minimal docs structure
-        docs_dir = tmp_path / "docs"
-        docs_dir.mkdir()
-        rules_dir = tmp_path / "docs" / "general" / "agent-rules"
-        rules_dir.mkdir(parents=True)
-        (rules_dir / "test-rule.md").write_text("# Test")
+        _scaffold(tmp_path, {"docs/general/agent-rules/test-rule.md": "# Test"})
 
-        monkeypatch.chdir(tmp_path)
         install()
 
         # Check all configs exist
-        assert (tmp_path / ".speculate" / "settings.yml").exists()
-        assert (tmp_path / "CLAUDE.md").exists()
-        assert (tmp_path / "AGENTS.md").exists()
-        assert (tmp_path / ".cursor" / "rules").exists()
+        assert _stat_kind(tmp_path / ".speculate" / "settings.yml") == "file"
+        assert _stat_kind(tmp_path / "CLAUDE.md") == "symlink"
+        assert _stat_kind(tmp_path / "AGENTS.md") == "file"
+        assert _stat_kind(tmp_path / ".cursor" / "rules") == "dir"
 
-    def test_creates_claude_md_as_symlink_when_not_exists(
-        self, tmp_path: Path, monkeypatch: MonkeyPatch
-    ):
+    def test_creates_claude_md_as_symlink_when_not_exists(self, tmp_path: Path):
         """Should create CLAUDE.md as symlink to AGENTS.md when CLAUDE.md doesn't exist."""
         docs_dir = tmp_path / "docs"
         docs_dir.mkdir()
 
-        monkeypatch.chdir(tmp_path)
         install()
 
         claude_md = tmp_path / "CLAUDE.md"
         agents_md = tmp_path / "AGENTS.md"
 
         # CLAUDE.md should be a symlink
-        assert claude_md.is_symlink()
+        assert _stat_kind(claude_md) == "symlink"
         # AGENTS.md should be a regular file
-        assert agents_md.exists()
-        assert not agents_md.is_symlink()
+        assert _stat_kind(agents_md) == "file"
         # CLAUDE.md should point to AGENTS.md
         assert os.readlink(claude_md) == "AGENTS.md"
         # AGENTS.md should have the speculate header
         assert SPECULATE_MARKER in agents_md.read_text()
 
-    def test_preserves_existing_claude_md_file(self, tmp_path: Path, monkeypatch: MonkeyPatch):
+    def test_preserves_existing_claude_md_file(self, tmp_path: Path):
         """Should preserve existing CLAUDE.md as a file (not convert to symlink)."""
         docs_dir = tmp_path / "docs"
         docs_dir.mkdir()
@@ -275,24 +403,20 @@ class TestInstallCommand:
         claude_md = tmp_path / "CLAUDE.md"
         claude_md.write_text("# My custom CLAUDE instructions")
 
-        monkeypatch.chdir(tmp_path)
         install()
 
         # CLAUDE.md should still be a regular file, not a symlink
-        assert not claude_md.is_symlink()
-        assert claude_md.exists()
+        assert _stat_kind(claude_md) == "file"
         # Should have speculate header prepended
         content = claude_md.read_text()
         assert SPECULATE_MARKER in content
         assert "My custom CLAUDE instructions" in content
 
-    def test_idempotent_with_claude_symlink(self, tmp_path: Path, monkeypatch: MonkeyPatch):
+    def test_idempotent_with_claude_symlink(self, tmp_path: Path):
         """Running install twice should be idempotent when CLAUDE.md is a symlink."""
         docs_dir = tmp_path / "docs"
         docs_dir.mkdir()
 
-        monkeypatch.chdir(tmp_path)
-
         # First install
         install()
 
@@ -304,56 +428,39 @@ class TestInstallCommand:
         install()
 
         # CLAUDE.md should still be a symlink
-        assert claude_md.is_symlink()
+        assert _stat_kind(claude_md) == "symlink"
         # AGENTS.md content should be unchanged (idempotent)
         assert agents_md.read_text() == agents_content_after_first
 
 
+@pytest.mark.usefixtures("chdir_tmp")
 class TestStatusCommand:
     """Tests for status command."""
 
-    def test_fails_without_development_md(self, tmp_path: Path, monkeypatch: MonkeyPatch):
+    def test_fails_without_development_md(self, tmp_path: Path):
         """Should fail if development.md is missing."""
-        docs_dir = tmp_path / "docs"
-        docs_dir.mkdir()
+        (tmp_path / "docs").mkdir()
         # Create copier-answers so it doesn't fail on that first
-        speculate_dir = tmp_path / ".speculate"
-        speculate_dir.mkdir()
-        (speculate_dir / "copier-answers.yml").write_text(
-            yaml.dump({"_commit": "abc123", "_src_path": "test"})
-        )
-
-        monkeypatch.chdir(tmp_path)
+        _scaffold(tmp_path, {".speculate/copier-answers.yml": _COPIER_ANSWERS_BYTES})
 
-        with pytest.raises(SystemExit) as exc_info:
-            status()
-        assert exc_info.value.code == 1
+        _expect_exit(status, expected=1)
 
-    def test_fails_without_copier_answers(self, tmp_path: Path, monkeypatch: MonkeyPatch):
+    def test_fails_without_copier_answers(self, tmp_path: Path):
         """Should fail if .speculate/copier-answers.yml is missing."""
-        docs_dir = tmp_path / "docs"
-        docs_dir.mkdir()
-        (docs_dir / "development.md").write_text("# Development")
+        _scaffold(tmp_path, {"docs/development.md": "# Development"})
 
-        monkeypatch.chdir(tmp_path)
+        _expect_exit(status, expected=1)
 
-        with pytest.raises(SystemExit) as exc_info:
-            status()
-        assert exc_info.value.code == 1
-
-    def test_succeeds_with_all_required_files(self, tmp_path: Path, monkeypatch: MonkeyPatch):
+    def test_succeeds_with_all_required_files(self, tmp_path: Path):
         """Should succeed if development.md and .speculate/copier-answers.yml exist."""
-        docs_dir = tmp_path / "docs"
-        docs_dir.mkdir()
-        (docs_dir / "development.md").write_text("# Development")
-        speculate_dir = tmp_path / ".speculate"
-        speculate_dir.mkdir()
-        (speculate_dir / "copier-answers.yml").write_text(
-            yaml.dump({"_commit": "abc123", "_src_path": "test"})
+        _scaffold(
+            tmp_path,
+            {
+                "docs/development.md": "# Development",
+                ".speculate/copier-answers.yml": _COPIER_ANSWERS_BYTES,
+            },
         )
 
-        monkeypatch.chdir(tmp_path)
-
         # Should not raise
         status()
 
@@ -386,7 +493,7 @@ class TestEnsureSpeculateHeader:
     def test_idempotent_when_header_present(self, tmp_path: Path):
         """Should not modify file if header already present."""
         test_file = tmp_path / "CLAUDE.md"
-        original_content = SPECULATE_HEADER + "\n\n# Custom stuff"
+        original_content = _HEADER_PLUS_BLANK + "# Custom stuff"
         test_file.write_text(original_content)
 
         _ensure_speculate_header(test_file)
@@ -419,7 +526,7 @@ class TestRemoveSpeculateHeader:
         """Should remove header but preserve other content."""
         test_file = tmp_path / "CLAUDE.md"
         custom_content = "# My Custom Instructions\n\nDo this and that."
-        test_file.write_text(SPECULATE_HEADER + "\n\n" + custom_content)
+        test_file.write_text(_HEADER_PLUS_BLANK + custom_content)
 
         _remove_speculate_header(test_file)
 
@@ -445,7 +552,7 @@ class TestRemoveSpeculateHeader:
     def test_deletes_file_if_empty_after_removal(self, tmp_path: Path):
         """Should delete file if it becomes empty after header removal."""
         test_file = tmp_path / "CLAUDE.md"
-        test_file.write_text(SPECULATE_HEADER + "\n")
+        test_file.write_bytes(_HEADER_PLUS_NL_BYTES)
 
         _remove_speculate_header(test_file)
 
@@ -474,127 +581,237 @@ class TestRemoveSpeculateHeader:
 class TestRemoveCursorRules:
     """Tests for _remove_cursor_rules function."""
 
-    def test_removes_symlinks(self, tmp_path: Path):
-        """Should remove symlinks from .cursor/rules/."""
-        rules_dir = tmp_path / "docs" / "general" / "agent-rules"
-        rules_dir.mkdir(parents=True)
-        (rules_dir / "test.md").write_text("# Test")
-
-        cursor_dir = tmp_path / ".cursor" / "rules"
-        cursor_dir.mkdir(parents=True)
-        link = cursor_dir / "test.mdc"
-        link.symlink_to(Path("..") / ".." / "docs" / "general" / "agent-rules" / "test.md")
-
-        _remove_cursor_rules(tmp_path)
-
-        assert not link.exists()
-
-    def test_preserves_non_symlinks(self, tmp_path: Path):
-        """Should not remove regular files."""
-        cursor_dir = tmp_path / ".cursor" / "rules"
-        cursor_dir.mkdir(parents=True)
-        regular_file = cursor_dir / "custom.mdc"
-        regular_file.write_text("# Custom rules")
+    @pytest.mark.parametrize(
+        "setup,expected_kept,expected_removed",
+        [
+            pytest.param(
+                {
+                    "docs/general/agent-rules/test.md": "# Test",
+                    ".cursor/rules/test.mdc": _Symlink("../../docs/general/agent-rules/test.md"),
+                },
+                [],
+                [".cursor/rules/test.mdc"],
+                id="removes-symlinks",
+            ),
+            pytest.param(
+                {".cursor/rules/custom.mdc": "# Custom rules"},
+                [".cursor/rules/custom.mdc"],
+                [],
+                id="preserves-non-symlinks",
+            ),
+            pytest.param({}, [], [], id="cursor-dir-missing"),
+        ],
+    )
+    def test_remove_cursor_rules(
+        self,
+        tmp_path: Path,
+        setup: dict[str, str | bytes | _Symlink],
+        expected_kept: list[str],
+        expected_removed: list[str],
+    ):
+        """Should remove speculate symlinks only, and not fail if .cursor/rules/ is missing."""
+        _scaffold(tmp_path, setup)
 
         _remove_cursor_rules(tmp_path)
 
-        assert regular_file.exists()
-
-    def test_no_error_if_cursor_dir_missing(self, tmp_path: Path):
-        """Should not raise error if .cursor/rules/ doesn't exist."""
-        # Should not raise
-        _remove_cursor_rules(tmp_path)
+        for rel in expected_kept:
+            assert _stat_kind(tmp_path / rel) == (
+                "symlink" if isinstance(setup[rel], _Symlink) else "file"
+            )
+        for rel in expected_removed:
+            assert _stat_kind(tmp_path / rel) is None
 
 
+@pytest.mark.usefixtures("chdir_tmp")
 class TestUninstallCommand:
     """Tests for uninstall command."""
 
-    def test_removes_all_tool_configs(self, tmp_path: Path, monkeypatch: MonkeyPatch):
+    def test_removes_all_tool_configs(self, tmp_path: Path):
         """Should remove all tool configurations."""
-        # Setup: create docs and run install
-        docs_dir = tmp_path / "docs"
-        docs_dir.mkdir()
-        rules_dir = tmp_path / "docs" / "general" / "agent-rules"
-        rules_dir.mkdir(parents=True)
-        (rules_dir / "test-rule.md").write_text("# Test")
-
-        monkeypatch.chdir(tmp_path)
-        install()
-
-        # Verify configs exist
-        assert (tmp_path / "CLAUDE.md").exists()
-        assert (tmp_path / "AGENTS.md").exists()
-        assert (tmp_path / ".speculate" / "settings.yml").exists()
-        assert (tmp_path / ".cursor" / "rules" / "test-rule.mdc").is_symlink()
+        # Setup: write the state install() would produce, without running it
+        _scaffold(
+            tmp_path,
+            {
+                "docs/general/agent-rules/test-rule.md": "# Test",
+                ".speculate/settings.yml": "last_update: x\n",
+                "AGENTS.md": _HEADER_PLUS_NL,
+                "CLAUDE.md": _Symlink("AGENTS.md"),
+                ".cursor/rules/test-rule.mdc": _RULE_LINK,
+                ".speculate/installed_links.json": json.dumps([".cursor/rules/test-rule.mdc"]),
+            },
+        )
+        cursor_dir = tmp_path / ".cursor" / "rules"
 
         # Run uninstall with force
         uninstall(force=True)
 
-        # Verify headers removed (files may be deleted if empty)
-        claude_md = tmp_path / "CLAUDE.md"
-        if claude_md.exists():
-            assert SPECULATE_MARKER not in claude_md.read_text()
-
-        agents_md = tmp_path / "AGENTS.md"
-        if agents_md.exists():
-            assert SPECULATE_MARKER not in agents_md.read_text()
+        # Header-only files should be deleted entirely
+        assert _stat_kind(tmp_path / "CLAUDE.md") is None
+        assert _stat_kind(tmp_path / "AGENTS.md") is None
 
         # Settings should be removed
-        assert not (tmp_path / ".speculate" / "settings.yml").exists()
+        assert _stat_kind(tmp_path / ".speculate" / "settings.yml") is None
 
-        # Symlinks should be removed
-        assert not (tmp_path / ".cursor" / "rules" / "test-rule.mdc").exists()
+        # Symlinks and the manifest should be removed
+        assert _stat_kind(cursor_dir / "test-rule.mdc") is None
+        assert _stat_kind(tmp_path / ".speculate" / "installed_links.json") is None
 
-    def test_preserves_docs_directory(self, tmp_path: Path, monkeypatch: MonkeyPatch):
+    def test_preserves_docs_directory(self, tmp_path: Path):
         """Should not remove docs/ directory."""
         docs_dir = tmp_path / "docs"
         docs_dir.mkdir()
         (docs_dir / "test.md").write_text("# Test")
 
-        monkeypatch.chdir(tmp_path)
-
         # Create a marker file to test with
         claude_md = tmp_path / "CLAUDE.md"
-        claude_md.write_text(SPECULATE_HEADER + "\n")
+        claude_md.write_bytes(_HEADER_PLUS_NL_BYTES)
 
         uninstall(force=True)
 
-        assert docs_dir.exists()
-        assert (docs_dir / "test.md").exists()
+        assert _stat_kind(docs_dir) == "dir"
+        assert _stat_kind(docs_dir / "test.md") == "file"
 
-    def test_preserves_copier_answers(self, tmp_path: Path, monkeypatch: MonkeyPatch):
+    def test_preserves_copier_answers(self, tmp_path: Path):
         """Should not remove .speculate/copier-answers.yml."""
         speculate_dir = tmp_path / ".speculate"
         speculate_dir.mkdir()
         copier_answers = speculate_dir / "copier-answers.yml"
-        copier_answers.write_text(yaml.dump({"_commit": "abc123"}))
+        copier_answers.write_bytes(_COPIER_ANSWERS_BYTES)
 
         # Create a marker file to test with
         claude_md = tmp_path / "CLAUDE.md"
-        claude_md.write_text(SPECULATE_HEADER + "\n")
+        claude_md.write_bytes(_HEADER_PLUS_NL_BYTES)
+
+        uninstall(force=True)
+
+        assert _stat_kind(copier_answers) == "file"
+
+    def test_uninstall_reads_manifest(self, tmp_path: Path):
+        """Should remove exactly the links listed in .speculate/installed_links.json."""
+        _scaffold(
+            tmp_path,
+            {
+                "docs/general/agent-rules/test-rule.md": "# Test",
+                ".speculate/installed_links.json": json.dumps([".cursor/rules/test-rule.mdc"]),
+                ".cursor/rules/test-rule.mdc": _RULE_LINK,
+                # Not in the manifest, so left alone even though it points to speculate docs
+                ".cursor/rules/user-link.mdc": _RULE_LINK,
+            },
+        )
+        cursor_dir = tmp_path / ".cursor" / "rules"
 
-        monkeypatch.chdir(tmp_path)
         uninstall(force=True)
 
-        assert copier_answers.exists()
+        assert _stat_kind(cursor_dir / "test-rule.mdc") is None
+        assert _stat_kind(cursor_dir / "user-link.mdc") == "symlink"
+        assert _stat_kind(tmp_path / ".speculate" / "installed_links.json") is None
+
+    def test_install_then_uninstall_uses_written_manifest(self, tmp_path: Path):
+        """Uninstall should remove the links recorded by install(), and the manifest."""
+        _scaffold(
+            tmp_path,
+            {
+                "docs/general/agent-rules/general-rules.md": "# General Rules",
+                "docs/project/agent-rules/project-rules.md": "# Project Rules",
+            },
+        )
+        install()
+        cursor_dir = tmp_path / ".cursor" / "rules"
+        manifest = tmp_path / ".speculate" / "installed_links.json"
+        assert _stat_kind(manifest) == "file"
 
-    def test_nothing_to_uninstall(self, tmp_path: Path, monkeypatch: MonkeyPatch):
-        """Should handle case when nothing is installed."""
-        monkeypatch.chdir(tmp_path)
+        uninstall(force=True)
 
+        assert _stat_kind(cursor_dir / "general-rules.mdc") is None
+        assert _stat_kind(cursor_dir / "project-rules.mdc") is None
+        assert _stat_kind(manifest) is None
+
+    def test_upgrade_from_pre_manifest_install_records_existing_links(self, tmp_path: Path):
+        """Links from installs without a manifest should be recorded even if now filtered."""
+        _scaffold(
+            tmp_path,
+            {
+                "docs/general/agent-rules/a.md": "# A",
+                "docs/general/agent-rules/b.md": "# B",
+                ".cursor/rules/a.mdc": _Symlink("../../docs/general/agent-rules/a.md"),
+                ".cursor/rules/b.mdc": _Symlink("../../docs/general/agent-rules/b.md"),
+            },
+        )
+        cursor_dir = tmp_path / ".cursor" / "rules"
+
+        _setup_cursor_rules(tmp_path, include=["a.md"])
+        uninstall(force=True)
+
+        assert _stat_kind(cursor_dir / "a.mdc") is None
+        assert _stat_kind(cursor_dir / "b.mdc") is None
+
+    def test_uninstall_keeps_user_owned_link_listed_in_manifest(self, tmp_path: Path):
+        """Manifest entries whose target is outside agent-rules should not be removed."""
+        _scaffold(
+            tmp_path,
+            {
+                ".speculate/installed_links.json": json.dumps([".cursor/rules/python-rules.mdc"]),
+                ".cursor/rules/python-rules.mdc": _Symlink("../../mine/py.md"),
+            },
+        )
+        cursor_dir = tmp_path / ".cursor" / "rules"
+
+        uninstall(force=True)
+
+        assert _stat_kind(cursor_dir / "python-rules.mdc") == "symlink"
+
+    def test_uninstall_ignores_manifest_entries_outside_cursor_rules(self, tmp_path: Path):
+        """Manifest entries outside .cursor/rules/ should never be unlinked."""
+        target = "docs/general/agent-rules/test-rule.md"
+        _scaffold(
+            tmp_path,
+            {
+                target: "# Test",
+                ".speculate/installed_links.json": json.dumps(
+                    ["outside.mdc", ".cursor/rules/../../outside2.mdc"]
+                ),
+                "outside.mdc": _Symlink(target),
+                "outside2.mdc": _Symlink(target),
+            },
+        )
+
+        uninstall(force=True)
+
+        assert _stat_kind(tmp_path / "outside.mdc") == "symlink"
+        assert _stat_kind(tmp_path / "outside2.mdc") == "symlink"
+        assert _stat_kind(tmp_path / ".speculate" / "installed_links.json") is None
+
+    def test_uninstall_falls_back_on_corrupt_manifest(self, tmp_path: Path):
+        """An unparsable manifest should be treated as missing (scan .cursor/rules/)."""
+        _scaffold(
+            tmp_path,
+            {
+                "docs/general/agent-rules/test-rule.md": "# Test",
+                ".speculate/installed_links.json": "{bad",
+                ".cursor/rules/test-rule.mdc": _RULE_LINK,
+            },
+        )
+        cursor_dir = tmp_path / ".cursor" / "rules"
+
+        uninstall(force=True)
+
+        assert _stat_kind(cursor_dir / "test-rule.mdc") is None
+        assert _stat_kind(tmp_path / ".speculate" / "installed_links.json") is None
+
+    def test_nothing_to_uninstall(self, tmp_path: Path):
+        """Should handle case when nothing is installed."""
         # Should not raise
         uninstall(force=True)
 
-    def test_preserves_custom_content_in_claude_md(self, tmp_path: Path, monkeypatch: MonkeyPatch):
+    def test_preserves_custom_content_in_claude_md(self, tmp_path: Path):
         """Should preserve custom content in CLAUDE.md after removing header."""
         custom_content = "# My Custom Instructions\n\nThese are my rules."
         claude_md = tmp_path / "CLAUDE.md"
-        claude_md.write_text(SPECULATE_HEADER + "\n\n" + custom_content)
+        claude_md.write_text(_HEADER_PLUS_BLANK + custom_content)
 
-        monkeypatch.chdir(tmp_path)
         uninstall(force=True)
 
-        assert claude_md.exists()
+        assert _stat_kind(claude_md) == "file"
         content = claude_md.read_text()
         assert SPECULATE_MARKER not in content
         assert "My Custom Instructions" in content